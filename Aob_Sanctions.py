@@ -1,11 +1,15 @@
-from playwright.sync_api import sync_playwright, TimeoutError
+import asyncio
 import csv
-import time
 from datetime import datetime
+from browser_manager import use_browser
+from records import AOBSanctionRecord
+from validation import SourceValidator, ValidationError, publish_when_valid
 
-def flatten_html(cell):
+URL = "https://www.sc.com.my/aob/aobs-sanctions"
+
+async def flatten_html(cell):
     """Flatten HTML into plain text for CSV."""
-    text = cell.inner_text()
+    text = await cell.inner_text()
     return " ".join(text.split())  # remove extra spaces/newlines
 
 def format_date(date_string: str) -> str:
@@ -25,96 +29,119 @@ def format_date(date_string: str) -> str:
             continue
     return date_string
 
-def scrape_aob_sanctions():
-    url = "https://www.sc.com.my/aob/aobs-sanctions"
-
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-        page.goto(url)
-        time.sleep(2)
-
-        # Get all dropdowns for the years
-        dropdowns = page.query_selector_all("a.st-header")
-
-        with open("aob_sanctions_all_years.csv", "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                'Year', 'No.', 'Nature of Misconduct', 'Auditor',
-                'Brief Description of Misconduct', 'Action Taken', "Date of AOB's Action",
-                'Dataset', 'Topics', 'Source Name', 'Country', 'Source URL'
-            ])
-
-            for dropdown in dropdowns:
-                year_text = dropdown.inner_text().split("Sanctions")[0].strip()
-                print(f"Scraping: {year_text} Sanctions")
-
-                try:
-                    # Expand dropdown by clicking it
-                    dropdown.click()
-                    time.sleep(1)  # small wait for table to render
-
-                    # The table is the next sibling of the dropdown
-                    wrapper = dropdown.evaluate_handle("el => el.nextElementSibling")
-                    table = wrapper.query_selector("table")
-                    if not table:
-                        print(f"No table found for {year_text}, skipping...")
-                        continue
-
-                    rows = table.query_selector_all("tr")
-                    rowspan_tracker = {}
-
-                    for row in rows:
-                        cols = row.query_selector_all("td")
-                        if not cols:
-                            continue  # skip header or empty rows
-                        row_data = []
-                        col_idx = 0
-
-                        while col_idx < 6:  # each table has 6 columns
-                            if col_idx in rowspan_tracker and rowspan_tracker[col_idx]['rows_left'] > 0:
-                                row_data.append(rowspan_tracker[col_idx]['text'])
-                                rowspan_tracker[col_idx]['rows_left'] -= 1
-                                col_idx += 1
-                                continue
+async def read_signal(browser, page):
+    """Cheap change signal for watch mode: the year dropdown headers."""
+    await browser.goto(page, URL)
+    await page.wait_for_selector("a.st-header")
+    return [(await dropdown.inner_text()).strip()
+            for dropdown in await page.query_selector_all("a.st-header")]
 
-                            if cols:
-                                cell = cols.pop(0)
-                                text = flatten_html(cell)
-                                colspan = int(cell.get_attribute("colspan") or 1)
-                                rowspan = int(cell.get_attribute("rowspan") or 1)
-
-                                for _ in range(colspan):
-                                    row_data.append(text)
-                                    if rowspan > 1:
-                                        rowspan_tracker[col_idx] = {'text': text, 'rows_left': rowspan-1}
+async def scrape_aob_sanctions_async(manager=None, dataset=None):
+    async with use_browser(manager) as browser:
+        page = await browser.new_page("sc.com.my", "AOB Sanctions")
+        try:
+            await browser.goto(page, URL)
+            await asyncio.sleep(2)
+
+            # Get all dropdowns for the years
+            dropdowns = await page.query_selector_all("a.st-header")
+
+            validator = SourceValidator("AOB Sanctions")
+            with publish_when_valid("aob_sanctions_all_years.csv", validator) as out_path, \
+                    open(out_path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(AOBSanctionRecord.headers())
+
+                for dropdown in dropdowns:
+                    year_text = (await dropdown.inner_text()).split("Sanctions")[0].strip()
+                    print(f"Scraping: {year_text} Sanctions")
+
+                    try:
+                        # Expand dropdown by clicking it
+                        await dropdown.click()
+                        await asyncio.sleep(1)  # small wait for table to render
+
+                        # The table is the next sibling of the dropdown
+                        wrapper = await dropdown.evaluate_handle("el => el.nextElementSibling")
+                        table = await wrapper.query_selector("table")
+                        if not table:
+                            print(f"No table found for {year_text}, skipping...")
+                            continue
+
+                        rows = await table.query_selector_all("tr")
+                        rowspan_tracker = {}
+                        page_records = []
+                        drift = None
+
+                        for row in rows:
+                            cols = await row.query_selector_all("td")
+                            if not cols:
+                                continue  # skip header or empty rows
+                            row_data = []
+                            col_idx = 0
+
+                            while col_idx < 6:  # each table has 6 columns
+                                if col_idx in rowspan_tracker and rowspan_tracker[col_idx]['rows_left'] > 0:
+                                    row_data.append(rowspan_tracker[col_idx]['text'])
+                                    rowspan_tracker[col_idx]['rows_left'] -= 1
+                                    col_idx += 1
+                                    continue
+
+                                if cols:
+                                    cell = cols.pop(0)
+                                    text = await flatten_html(cell)
+                                    colspan = int(await cell.get_attribute("colspan") or 1)
+                                    rowspan = int(await cell.get_attribute("rowspan") or 1)
+
+                                    for _ in range(colspan):
+                                        row_data.append(text)
+                                        if rowspan > 1:
+                                            rowspan_tracker[col_idx] = {'text': text, 'rows_left': rowspan-1}
+                                        col_idx += 1
+                                else:
+                                    row_data.append("")
                                     col_idx += 1
-                            else:
-                                row_data.append("")
-                                col_idx += 1
-
-                        if len(row_data) < 6:
-                            row_data += [""] * (6 - len(row_data))
-
-                        # Format the date column before writing
-                        row_data[5] = format_date(row_data[5])
-
-                        if any(cell.strip() for cell in row_data):  # only if at least one column has text
-                            writer.writerow([
-                                year_text + " Sanctions"
-                            ] + row_data + [
-                                "Suruhanjaya Sekuriti Securities commission malaysia",  # Dataset
-                                "fraud",  # Topics
-                                "Suruhanjaya Sekuriti Securities commission malaysia",  # Source Name
-                                "Malaysia",  # Country
-                                url  # Source URL
-                            ])
-
-                except Exception as e:
-                    print(f"Error scraping {year_text}: {e}")
-
-        browser.close()
+
+                            if len(row_data) < 6:
+                                row_data += [""] * (6 - len(row_data))
+
+                            # Cells left over mean the table has grown a column
+                            if cols:
+                                drift = f"{len(cols)} cells beyond the expected 6 columns"
+
+                            # Format the date column before writing
+                            row_data[5] = format_date(row_data[5])
+
+                            if any(cell.strip() for cell in row_data):  # only if at least one column has text
+                                page_records.append(AOBSanctionRecord(year_text + " Sanctions", *row_data[:6], URL))
+
+                        # A table whose layout changed is set aside, not published
+                        if drift:
+                            validator.schema_drift(year_text, drift)
+                            validator.quarantine(year_text, drift, [r.as_row() for r in page_records])
+                            continue
+
+                        for record in page_records:
+                            if record.validate():
+                                print(f"Unparsed date in {year_text}: {record.date}")
+                            validator.add(record)
+                            writer.writerow(record.as_row())
+                            if dataset is not None:
+                                dataset.add(record)
+                            browser.first_row("AOB Sanctions")
+
+                    except ValidationError:
+                        raise
+                    except Exception as e:
+                        print(f"Error scraping {year_text}: {e}")
+                        validator.page_failed(year_text, e)
+        finally:
+            await page.close()
         print("Scraping completed. Data saved to aob_sanctions_all_years.csv")
 
+def scrape_aob_sanctions():
+    """Blocking entry point; runs the async scraper on its own event loop."""
+    asyncio.run(scrape_aob_sanctions_async())
+
 if __name__ == "__main__":
-    scrape_aob_sanctions()
\ No newline at end of file
+    scrape_aob_sanctions()
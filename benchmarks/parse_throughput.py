@@ -0,0 +1,71 @@
+"""Parser throughput as the process pool grows.
+
+Builds a synthetic fixture set of court order pages and parses it with
+parsers.parse_court_orders_page, first in-process and then through a
+ProcessPoolExecutor with 1, 2, 4, ... workers.
+
+    python benchmarks/parse_throughput.py --pages 2000 --rows 50
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from parsers import parse_court_orders_page
+
+ROW = (
+    "<tr><td>{n}</td>"
+    "<td>SYARIKAT CONTOH {n} SDN BHD&nbsp;({n:06d}-X)<br>No. {n}, Jalan Ampang,<br>50450 Kuala Lumpur</td>"
+    "<td>Ahmad bin Ali ({n:06d}-01-1234)<br>Tan Ah Kow ({n:06d}-10-5678)</td>"
+    "<td>{day} January 2023</td><td>{day:02d}/02/2023</td></tr>"
+)
+
+def make_fixtures(pages: int, rows: int) -> list:
+    fixtures = []
+    for page in range(pages):
+        fixtures.append("".join(
+            ROW.format(n=page * rows + i, day=i % 28 + 1) for i in range(rows)
+        ))
+    return fixtures
+
+def worker_counts(limit: int) -> list:
+    counts = []
+    n = 1
+    while n < limit:
+        counts.append(n)
+        n *= 2
+    counts.append(limit)
+    return counts
+
+def run(fixtures, workers):
+    start = time.perf_counter()
+    if workers == 0:
+        parsed = [parse_court_orders_page(html) for html in fixtures]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parsed = list(pool.map(parse_court_orders_page, fixtures, chunksize=8))
+    elapsed = time.perf_counter() - start
+    return sum(len(rows) for rows in parsed), elapsed
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=2000)
+    parser.add_argument("--rows", type=int, default=50, help="rows per page")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    fixtures = make_fixtures(args.pages, args.rows)
+    size_mb = sum(len(html) for html in fixtures) / 1e6
+    print(f"{args.pages} pages x {args.rows} rows ({size_mb:.1f} MB of HTML)")
+    print(f"{'workers':>8} {'seconds':>9} {'pages/s':>9} {'rows/s':>10} {'speedup':>8}")
+
+    baseline = None
+    for workers in [0] + worker_counts(args.max_workers):
+        rows, elapsed = run(fixtures, workers)
+        baseline = baseline or elapsed
+        label = "inline" if workers == 0 else str(workers)
+        print(f"{label:>8} {elapsed:9.2f} {args.pages / elapsed:9.0f} "
+              f"{rows / elapsed:10.0f} {baseline / elapsed:7.2f}x")
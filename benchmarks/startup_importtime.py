@@ -0,0 +1,99 @@
+"""Import-time budget for the scraper entry points.
+
+Runs `python -X importtime -c "import <module>"` for every entry point in a
+fresh interpreter, reports the cumulative import time and the heaviest
+imports, and exits non-zero when a module goes over its budget or imports a
+heavy dependency eagerly.
+
+    python benchmarks/startup_importtime.py
+    python benchmarks/startup_importtime.py --runs 5 --show 10
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Import time allowed per entry point on top of asyncio, in milliseconds.
+# Every entry point needs asyncio, and its cost varies a lot between machines,
+# so it is measured in the same run and left out of the budget. Heavy
+# dependencies (playwright, pandas, openpyxl, lxml, deep_translator) are
+# imported lazily, so what is left is our own modules and a few stdlib ones.
+BUDGET_MS = {
+    "Administrative_Actions": 30,
+    "Aob_Sanctions": 30,
+    "Compound_Cases": 30,
+    "Criminal_Prosecution": 30,
+    "bnm_Financial_Services": 40,
+    "consumer_alert": 30,
+    "court_orders": 40,
+    "wanted_persons": 30,
+    "run_all": 60,
+}
+BASELINE = "asyncio"
+
+# Imports that must not happen at import time of any entry point
+LAZY_ONLY = ("playwright", "pandas", "openpyxl", "lxml", "deep_translator", "bs4", "pyarrow")
+
+
+def import_times(module):
+    """Return [(cumulative_us, self_us, name)] for one fresh import of `module`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times.append((int(cumulative_us), int(self_us), name.strip()))
+    return times
+
+
+def measure(module, runs):
+    """Best-of-`runs` time for `module` excluding BASELINE, plus that run's imports."""
+    best = None
+    for _ in range(runs):
+        times = import_times(module)
+        total = next(cum for cum, _, name in times if name == module)
+        baseline = next((cum for cum, _, name in times if name == BASELINE), 0)
+        if best is None or total - baseline < best[0]:
+            best = (total - baseline, times)
+    return best
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3, help="fresh interpreters per module")
+    parser.add_argument("--show", type=int, default=5, help="heaviest imports to list")
+    parser.add_argument("modules", nargs="*", default=list(BUDGET_MS))
+    args = parser.parse_args()
+
+    failures = []
+    for module in args.modules:
+        budget = BUDGET_MS.get(module)
+        try:
+            total_us, times = measure(module, args.runs)
+        except RuntimeError as e:
+            print(f"❌ {module}: import failed ({e})")
+            failures.append(module)
+            continue
+
+        eager = sorted({name.split(".")[0] for _, _, name in times} & set(LAZY_ONLY))
+        over = budget is not None and total_us / 1000 > budget
+        status = "❌" if over or eager else "✅"
+        print(f"{status} {module}: {total_us / 1000:.1f} ms + {BASELINE} (budget {budget} ms)")
+        if eager:
+            print(f"    imported eagerly: {', '.join(eager)}")
+        for cum, _, name in sorted(times, reverse=True)[1:args.show + 1]:
+            print(f"    {cum / 1000:8.1f} ms  {name.strip()}")
+        if over or eager:
+            failures.append(module)
+
+    if failures:
+        print(f"Over budget: {', '.join(failures)}")
+        sys.exit(1)
@@ -1,38 +1,65 @@
 import asyncio
-from playwright.async_api import async_playwright
-import pandas as pd
-from bs4 import BeautifulSoup
+import csv
+from browser_manager import use_browser
+from parsers import COMPOUND_COLUMNS, parse_compound_table, parse_in_pool
+from records import CompoundRecord
+from validation import SourceValidator, publish_when_valid
 
 URL = "https://www.bnm.gov.my/-/ea-pn-20230901"
 
-async def scrape_table():
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=False)
-        page = await browser.new_page()
-        await page.goto(URL)
-        await page.wait_for_selector("table.standard-table")
+async def scrape_rows(manager=None, pool=None, validator=None):
+    async with use_browser(manager, headless=False) as browser:
+        page = await browser.new_page("bnm.gov.my", "BNM Financial Services")
+        try:
+            await browser.goto(page, URL)
+            await page.wait_for_selector("table.standard-table")
 
-        html = await page.inner_html("table.standard-table")
-        await browser.close()
+            html = await page.inner_html("table.standard-table")
+            browser.first_row("BNM Financial Services")
+        finally:
+            await page.close()
 
-    soup = BeautifulSoup(html, "html.parser")
+    # Header rows are skipped and the Total row padded by the parser. One small
+    # table is not worth starting a worker process for, so only use a shared pool.
+    if pool is not None:
+        rows = await parse_in_pool(pool, parse_compound_table, html)
+    else:
+        rows = parse_compound_table(html)
 
+    # A row with extra cells means the table layout changed
+    wide = [row for row in rows if len(row) > COMPOUND_COLUMNS]
+    if wide:
+        drift = f"{len(wide[0]) - COMPOUND_COLUMNS} cells beyond the expected {COMPOUND_COLUMNS} columns"
+        if validator is None:
+            raise ValueError(f"BNM Financial Services: {drift}")
+        validator.schema_drift(URL, drift)
+        validator.quarantine(URL, drift, rows)
+        return []
+    return [CompoundRecord(*row) for row in rows]
+
+async def scrape_table(manager=None, pool=None):
+    """Same rows as scrape_rows(), as a pandas DataFrame."""
+    import pandas as pd
+
+    rows = await scrape_rows(manager, pool)
     # Headers: only lower-level or standalone
-    headers = ["No.", "Entities", "Compound (RM, million) under - S. 253 FSA", "Compound (RM, million) under - S. 92", "Total (RM, million)"]
-
-    rows = []
-    for tr in soup.find_all("tr")[2:]:  # skip header rows
-        cells = tr.find_all("td")
-        row = [td.get_text(strip=True) for td in cells]
-        # Pad if necessary (for the Total row)
-        if len(row) < len(headers):
-            row = [""] * (len(headers) - len(row)) + row
-        rows.append(row)
-
-    df = pd.DataFrame(rows, columns=headers)
+    headers = CompoundRecord.headers()
+    df = pd.DataFrame([record.as_row() for record in rows], columns=headers)
     return df
 
+async def main(manager=None, pool=None, dataset=None):
+    validator = SourceValidator("BNM Financial Services")
+    rows = await scrape_rows(manager, pool, validator)
+    with publish_when_valid("bnm_Financial_Services.csv", validator) as out_path, \
+            open(out_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, lineterminator="\n")  # same line endings as the old to_csv
+        writer.writerow(CompoundRecord.headers())
+        for record in rows:
+            print(record.as_row())
+            validator.add(record)
+            writer.writerow(record.as_row())
+            if dataset is not None:
+                dataset.add(record)
+
 if __name__ == "__main__":
-    df = asyncio.run(scrape_table())
-    print(df)
-    df.to_csv("bnm_Financial_Services.csv", index=False)
\ No newline at end of file
+    asyncio.run(main())
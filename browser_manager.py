@@ -0,0 +1,165 @@
+import asyncio
+import csv
+import os
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime
+from politeness import PolitenessScheduler
+
+# ----------------------------
+# Settings
+# ----------------------------
+# Cookies and localStorage (consent banners, session cookies) are kept per site
+# in STATE_DIR and restored on the next run.
+STATE_DIR = os.environ.get("SCRAPER_STATE_DIR", ".browser_state")
+
+# Set to the ws:// endpoint of a long-lived browser server to skip Chromium
+# startup, e.g. after `python -m playwright run-server --port 3000`:
+#   PLAYWRIGHT_WS_ENDPOINT=ws://localhost:3000/
+WS_ENDPOINT = os.environ.get("PLAYWRIGHT_WS_ENDPOINT")
+
+FIRST_ROW_LOG = "first_row_times.csv"
+
+
+# ----------------------------
+# Browser manager
+# ----------------------------
+class BrowserManager:
+    """One browser shared by all sources, with one reusable context per site.
+
+    Use as `async with BrowserManager() as browser:` and open pages with
+    `browser.new_page(site, source)`. Navigation goes through `browser.goto()`
+    and in-page requests through `browser.paced()` so every host is rate
+    limited by the shared PolitenessScheduler. Scrapers call
+    `browser.first_row(source)` when they have their first row so
+    time-to-first-row can be tracked; a long-lived caller brackets each
+    scrape with `start_source()` and `log_first_rows([source])`.
+    """
+
+    def __init__(self, headless=True, args=None, state_dir=STATE_DIR, ws_endpoint=WS_ENDPOINT,
+                 scheduler=None):
+        self.headless = headless
+        self.args = args or []
+        self.state_dir = state_dir
+        self.ws_endpoint = ws_endpoint
+        self.scheduler = scheduler or PolitenessScheduler()
+        self.browser = None
+        self.contexts = {}
+        self.first_row_times = {}
+        self._playwright = None
+        self._context_lock = asyncio.Lock()
+        self._started = {}
+        self._launched_at = None
+
+    async def __aenter__(self):
+        from playwright.async_api import async_playwright
+
+        self._launched_at = time.perf_counter()
+        self._playwright = await async_playwright().start()
+        if self.ws_endpoint:
+            self.browser = await self._playwright.chromium.connect(self.ws_endpoint)
+        else:
+            self.browser = await self._playwright.chromium.launch(
+                headless=self.headless, args=self.args
+            )
+        print(f"🌐 Browser ready in {time.perf_counter() - self._launched_at:.2f} sec"
+              f" ({'connected' if self.ws_endpoint else 'launched'})")
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        try:
+            await self.save_state()
+            for context in self.contexts.values():
+                await context.close()
+            await self.browser.close()
+        finally:
+            await self._playwright.stop()
+        self.log_first_rows()
+        self.scheduler.print_stats()
+
+    def _state_path(self, site):
+        return os.path.join(self.state_dir, f"{site}.json")
+
+    async def context(self, site):
+        """Return the context for `site`, restoring its saved storage state once."""
+        async with self._context_lock:
+            if site not in self.contexts:
+                path = self._state_path(site)
+                self.contexts[site] = await self.browser.new_context(
+                    storage_state=path if os.path.exists(path) else None
+                )
+            return self.contexts[site]
+
+    async def new_page(self, site, source=None, viewport=None):
+        context = await self.context(site)
+        page = await context.new_page()
+        if viewport:
+            await page.set_viewport_size(viewport)
+        if source and source not in self._started:
+            self._started[source] = time.perf_counter()
+        return page
+
+    async def goto(self, page, url, **kwargs):
+        """Navigate `page` once the scheduler allows another request to the host."""
+        return await self.scheduler.goto(page, url, **kwargs)
+
+    def paced(self, page):
+        """Context manager pacing a click or postback on `page`'s current host."""
+        return self.scheduler.paced(page.url)
+
+    async def save_state(self):
+        os.makedirs(self.state_dir, exist_ok=True)
+        for site, context in self.contexts.items():
+            try:
+                await context.storage_state(path=self._state_path(site))
+            except Exception as e:
+                print(f"Could not save browser state for {site}: {e}")
+
+    # ----------------------------
+    # Time to first row
+    # ----------------------------
+    def start_source(self, source):
+        """Start timing a new scrape of `source`, forgetting any earlier one."""
+        self._started[source] = time.perf_counter()
+        self.first_row_times.pop(source, None)
+
+    def first_row(self, source):
+        """Record time-to-first-row for `source`; later calls are ignored."""
+        if source in self.first_row_times:
+            return
+        started = self._started.get(source, self._launched_at)
+        self.first_row_times[source] = time.perf_counter() - started
+
+    def log_first_rows(self, sources=None):
+        """Print the times of `sources` (default: all) and append them to the per-run log.
+
+        Logged sources are forgotten, so their next scrape is timed afresh.
+        """
+        times = {source: self.first_row_times.pop(source)
+                 for source in list(sources or self.first_row_times)
+                 if source in self.first_row_times}
+        for source in sources or list(self._started):
+            self._started.pop(source, None)
+        if not times:
+            return
+        os.makedirs(self.state_dir, exist_ok=True)
+        path = os.path.join(self.state_dir, FIRST_ROW_LOG)
+        new_file = not os.path.exists(path)
+        run_at = datetime.now().isoformat(timespec="seconds")
+        with open(path, "a", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            if new_file:
+                writer.writerow(["Run At", "Source", "Warm Start", "Seconds To First Row"])
+            for source, seconds in times.items():
+                print(f"⏱️ {source}: first row after {seconds:.2f} sec")
+                writer.writerow([run_at, source, bool(self.ws_endpoint), f"{seconds:.3f}"])
+
+
+@asynccontextmanager
+async def use_browser(manager=None, **kwargs):
+    """Yield `manager` if given, otherwise a BrowserManager owned by the caller."""
+    if manager is not None:
+        yield manager
+        return
+    async with BrowserManager(**kwargs) as own_manager:
+        yield own_manager
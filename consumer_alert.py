@@ -1,8 +1,11 @@
 import asyncio
-from playwright.async_api import async_playwright
-import pandas as pd
 import re
 from datetime import datetime
+from browser_manager import use_browser
+from records import ConsumerAlertRecord
+from validation import SourceValidator, ValidationError, publish_when_valid
+
+URL = "https://www.bnm.gov.my/financial-consumer-alert-list"
 
 # ------------------------
 # Date formatter
@@ -47,57 +50,98 @@ async def extract_cell_text(td):
             entries.append(le)
     return " | ".join(entries) if entries else "-"
 
+# ------------------------
+# Change signal for watch mode
+# ------------------------
+async def read_signal(browser, page):
+    """The DataTables entry count, e.g. "Showing 1 to 10 of 2,345 entries"."""
+    await browser.goto(page, URL)
+    await page.wait_for_selector("div.dataTables_info")
+    return (await page.inner_text("div.dataTables_info")).strip()
+
 # ------------------------
 # Main scraper
 # ------------------------
-async def scrape_bnm():
-    url = "https://www.bnm.gov.my/financial-consumer-alert-list"
+async def scrape_bnm(manager=None, dataset=None):
     all_data = []
+    validator = SourceValidator("BNM Consumer Alerts")
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=True,
-            args=["--disable-images", "--disable-css"]
+    async with use_browser(manager, args=["--disable-images", "--disable-css"]) as browser:
+        page = await browser.new_page(
+            "bnm.gov.my", "BNM Consumer Alerts", viewport={"width": 1280, "height": 800}
         )
-        page = await browser.new_page(viewport={"width": 1280, "height": 800})
-        await page.goto(url)
-        await page.wait_for_selector("table")
-
-        # Total pages
-        info_text = await page.inner_text("div.dataTables_info")
-        total_entries = int(re.search(r"of\s+(\d+)\s+entries", info_text).group(1))
-        rows_per_page = 10
-        total_pages = (total_entries + rows_per_page - 1) // rows_per_page
+        try:
+            await browser.goto(page, URL)
+            await page.wait_for_selector("table")
 
-        print(f"🔎 Found {total_pages} pages ({total_entries} entries). Starting scrape...")
+            # Total pages
+            info_text = await page.inner_text("div.dataTables_info")
+            # DataTables groups thousands, e.g. "of 2,345 entries"
+            match = re.search(r"of\s+([\d,]+)\s+entries", info_text)
+            if not match:
+                raise ValidationError(f"BNM Consumer Alerts: unexpected table info {info_text!r}")
+            total_entries = int(match.group(1).replace(",", ""))
+            validator.expect_rows(total_entries)
+            rows_per_page = 10
+            total_pages = (total_entries + rows_per_page - 1) // rows_per_page
 
-        for page_num in range(1, total_pages + 1):
-            print(f"📄 Scraping page {page_num}/{total_pages}...")
-            rows = await page.query_selector_all("table tbody tr")
+            print(f"🔎 Found {total_pages} pages ({total_entries} entries). Starting scrape...")
 
-            # Extract all rows concurrently
-            tasks = []
-            for row in rows:
-                tasks.append(scrape_row(row))
-            all_data.extend(await asyncio.gather(*tasks))
+            for page_num in range(1, total_pages + 1):
+                print(f"📄 Scraping page {page_num}/{total_pages}...")
+                rows = await page.query_selector_all("table tbody tr")
 
-            # Click "Next"
-            if page_num < total_pages:
-                next_button = await page.query_selector("a.paginate_button.next")
-                if next_button:
-                    await next_button.click()
-                    await page.wait_for_selector("table tbody tr")
+                # Extract all rows concurrently
+                tasks = []
+                for row in rows:
+                    tasks.append(scrape_row(row))
+                results = await asyncio.gather(*tasks)
+                validator.malformed(sum(1 for r in results if r is None))
+                for record in results:
+                    if record is not None:
+                        # Checked as we go, so a broken date format stops the scrape early
+                        validator.add(record)
+                        all_data.append(record)
+                if all_data:
+                    browser.first_row("BNM Consumer Alerts")
 
-        await browser.close()
+                # Click "Next"
+                if page_num < total_pages:
+                    next_button = await page.query_selector("a.paginate_button.next")
+                    if next_button:
+                        async with browser.paced(page):
+                            await next_button.click()
+                            await page.wait_for_selector("table tbody tr")
+        finally:
+            await page.close()
 
     # Save to Excel
-    df = pd.DataFrame(all_data)
-    if not df.empty:
-        df.to_excel("bnm_financial_alerts_playwright_fast.xlsx", index=False, engine="openpyxl")
-        print(f"✅ Saved {len(df)} records from {total_pages} pages to Excel")
-        print(df.head())
-    else:
+    bad_dates = sum(1 for record in all_data if record.validate())
+    if bad_dates:
+        print(f"⚠️ {bad_dates} records with unparsed dates")
+    if not all_data:
         print("❌ No data found")
+        validator.finish()  # raises, an empty run is not a success
+
+    with publish_when_valid("bnm_financial_alerts_playwright_fast.xlsx", validator) as out_path:
+        save_excel(all_data, out_path)
+    if dataset is not None:
+        for record in all_data:
+            dataset.add(record)
+    print(f"✅ Saved {len(all_data)} records from {total_pages} pages to Excel")
+    for record in all_data[:5]:
+        print(record.as_row())
+
+def save_excel(records, path):
+    # openpyxl is only needed here, keep it out of startup
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(title="Sheet1")  # the name df.to_excel used
+    sheet.append(ConsumerAlertRecord.headers())
+    for record in records:
+        sheet.append(record.as_row())
+    workbook.save(path)
 
 # ------------------------
 # Row scraper
@@ -105,22 +149,12 @@ async def scrape_bnm():
 async def scrape_row(row):
     cols = await row.query_selector_all("td")
     if len(cols) < 3:
-        return {}
+        return None
     entity_name = (await cols[0].inner_text()).strip() or "-"
     website_url = await extract_cell_text(cols[1])
     date_added = format_date((await cols[2].inner_text()).strip())
     remarks = (await cols[3].inner_text()).strip() if len(cols) > 3 else "-"
-    return {
-                    "Group(sdn Type)":"Company",
-                    "Entity Name": entity_name,
-                    "Website/URL": website_url,
-                    "Dataset": "Bank Negara Malaysia",
-                    "Source URL": "https://www.bnm.gov.my/financial-consumer-alert-list",
-                    "Topics": "Fraud",
-                    "Source Name": "Bank Negara Malaysia",
-                    "Country": "Malaysia",
-                    "Date Added": date_added
-    }
+    return ConsumerAlertRecord(entity_name, website_url, date_added)
 
 if __name__ == "__main__":
     asyncio.run(scrape_bnm())
\ No newline at end of file
@@ -0,0 +1,119 @@
+import os
+import re
+from datetime import datetime
+
+# ----------------------------
+# Settings
+# ----------------------------
+# Layout (hive partitioning, readable by pyarrow.dataset, DuckDB, Spark):
+#   <root>/source=<source>/run_id=<run>/partition_year=<yyyy>/part-<n>-0.parquet
+# The year partition is not called "year": it would clash with the SC/AOB
+# "Year" column in engines that resolve names case-insensitively (Spark).
+# Each run is a complete snapshot of its source under run_id=<run>;
+# <root>/source=<source>/_LATEST holds the newest completed run.
+DATASET_DIR = os.environ.get("SCRAPER_DATASET_DIR", "dataset")
+PARTITION_COLS = ["source", "run_id", "partition_year"]
+FLUSH_ROWS = 50_000
+COMPRESSION = "zstd"
+
+# Low-cardinality columns stored dictionary-encoded
+DICTIONARY_COLUMNS = ("Year", "Group(sdn Type)", "Dataset", "Topics", "Source Name", "Country", "Source URL")
+
+YEAR = re.compile(r"\b(19|20)\d{2}\b")
+
+
+def new_run_id():
+    return datetime.now().strftime("%Y%m%dT%H%M%S")
+
+def source_slug(name):
+    return re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_")
+
+def record_year(record):
+    """Year partition: the year the SC/AOB scrapers put in their Year column."""
+    match = YEAR.search(getattr(record, "year", "") or "")
+    return match.group(0) if match else None
+
+
+# ----------------------------
+# Dataset writer
+# ----------------------------
+class DatasetWriter:
+    """Buffer records of one source and write them as a partitioned Parquet dataset.
+
+    Use as a context manager around a scrape; `add()` each record. The
+    snapshot is only marked as latest when the block exits without error.
+    """
+
+    def __init__(self, source, root=DATASET_DIR, run_id=None, flush_rows=FLUSH_ROWS):
+        self.source = source_slug(source)
+        self.root = root
+        self.run_id = run_id or new_run_id()
+        self.flush_rows = flush_rows
+        self.records = []
+        self.batches = 0
+        self.rows_written = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        return False
+
+    def add(self, record):
+        self.records.append(record)
+        if len(self.records) >= self.flush_rows:
+            self.flush()
+
+    def flush(self):
+        if not self.records:
+            return
+        # pyarrow is only needed when exporting
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        headers = self.records[0].headers()
+        rows = [record.as_row() for record in self.records]
+        columns = {}
+        for i, header in enumerate(headers):
+            values = pa.array([row[i] for row in rows])
+            if header in DICTIONARY_COLUMNS:
+                values = values.dictionary_encode()
+            columns[header] = values
+        columns["source"] = pa.array([self.source] * len(rows))
+        columns["run_id"] = pa.array([self.run_id] * len(rows))
+        columns["partition_year"] = pa.array([record_year(record) for record in self.records], pa.string())
+        table = pa.table(columns)
+
+        pq.write_to_dataset(
+            table,
+            self.root,
+            partition_cols=PARTITION_COLS,
+            basename_template=f"part-{self.batches}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore",
+            compression=COMPRESSION,
+            use_dictionary=[h for h in headers if h in DICTIONARY_COLUMNS],
+        )
+        self.batches += 1
+        self.rows_written += len(rows)
+        self.records = []
+
+    def close(self):
+        self.flush()
+        if not self.rows_written:
+            return
+        latest = os.path.join(self.root, f"source={self.source}", "_LATEST")
+        with open(latest, "w", encoding="utf-8") as f:
+            f.write(self.run_id + "\n")
+        print(f"📦 {self.rows_written} rows exported to {self.root} "
+              f"(source={self.source}, run_id={self.run_id})")
+
+
+def latest_run(source, root=DATASET_DIR):
+    """Run ID of the newest complete snapshot of `source`, or None."""
+    path = os.path.join(root, f"source={source_slug(source)}", "_LATEST")
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return f.read().strip()
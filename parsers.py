@@ -0,0 +1,166 @@
+import asyncio
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+
+# ----------------------------
+# Parser process pool
+# ----------------------------
+# Fetchers hand raw HTML to these functions through a ProcessPoolExecutor so
+# parsing runs on other cores while the browser moves on to the next page.
+# Everything here must stay importable without Playwright and return plain
+# picklable values. Workers come from a forkserver: forking the scraper itself
+# would copy Playwright's and asyncio's threads mid-flight and can deadlock.
+
+@contextmanager
+def parser_pool(pool=None, max_workers=None):
+    """Yield `pool` if given, otherwise a fresh pool that is shut down on exit."""
+    if pool is not None:
+        yield pool
+        return
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count(),
+                             mp_context=multiprocessing.get_context("forkserver")) as own_pool:
+        yield own_pool
+
+async def parse_in_pool(pool, func, html):
+    """Run `func(html)` in the pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(pool, func, html)
+
+# ----------------------------
+# HTML helpers
+# ----------------------------
+BLOCK_TAGS = ("p", "div", "li", "tr")
+
+def fragment(html: str, wrapper: str):
+    """Parse an inner_html() fragment inside the given wrapper tags."""
+    # Imported here so only the parser workers pay for lxml
+    import lxml.html
+
+    opening = "".join(f"<{tag}>" for tag in wrapper.split())
+    closing = "".join(f"</{tag}>" for tag in reversed(wrapper.split()))
+    return lxml.html.fromstring(opening + html + closing)
+
+def cell_text(td) -> str:
+    """Approximate Playwright's inner_text(): <br> and block edges become newlines."""
+    for el in td.iter("br", *BLOCK_TAGS):
+        if el.tag in BLOCK_TAGS and el is not td:
+            # Text before a block ends its line too
+            previous = el.getprevious()
+            if previous is not None:
+                previous.tail = (previous.tail or "") + "\n"
+            else:
+                parent = el.getparent()
+                parent.text = (parent.text or "") + "\n"
+        el.tail = "\n" + (el.tail or "")
+    return td.text_content()
+
+# ----------------------------
+# bnm_Financial_Services.py
+# ----------------------------
+COMPOUND_COLUMNS = 5
+
+def parse_compound_table(html: str) -> list:
+    """Parse the inner HTML of table.standard-table into padded rows.
+
+    Rows with more than COMPOUND_COLUMNS cells are returned whole so the
+    caller can report the layout change.
+    """
+    table = fragment(html, "table")
+    rows = []
+    for tr in list(table.iter("tr"))[2:]:  # skip header rows
+        row = ["".join(s.strip() for s in td.itertext()) for td in tr.iter("td")]
+        # Pad if necessary (for the Total row)
+        if len(row) < COMPOUND_COLUMNS:
+            row = [""] * (COMPOUND_COLUMNS - len(row)) + row
+        rows.append(row)
+    return rows
+
+# ----------------------------
+# court_orders.py
+# ----------------------------
+INVISIBLE = re.compile(r"[\xa0\u200b]+")
+
+# --- Date formatting ---
+def format_date(date_text: str) -> str:
+    if not date_text:
+        return ""
+    for fmt in ("%d %B %Y", "%d/%m/%Y", "%d-%m-%Y"):
+        try:
+            dt = datetime.strptime(date_text.strip(), fmt)
+            return dt.strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    return date_text
+
+# --- Clean address ---
+def clean_address(address_text: str) -> str:
+    lines = [line.strip() for line in address_text.split("\n") if line.strip()]
+    return "; ".join(lines)
+
+# --- Split company info robustly ---
+def split_company_info(raw_text: str):
+    # Normalize spaces & remove invisible characters
+    raw_text = INVISIBLE.sub(" ", raw_text)
+    raw_text = re.sub(r"\s+", " ", raw_text).strip()
+
+    # Match: Name (ID) Address
+    m = re.match(r"^(.*?)\s*\(([^)]+)\)\s*(.*)$", raw_text)
+    if m:
+        company_name = m.group(1).strip()
+        company_id = f"({m.group(2).strip()})"
+        address = clean_address(m.group(3).strip())
+    else:
+        company_name = raw_text.strip()
+        company_id = ""
+        address = ""
+    return company_name, company_id, address
+
+# --- Split owners robustly ---
+def parse_owners(raw_text: str):
+    # Normalize spaces & remove invisible chars
+    raw_text = INVISIBLE.sub(" ", raw_text)
+    lines = [line.strip() for line in raw_text.split("\n") if line.strip()]
+    owners = []
+    for line in lines:
+        m_owner = re.match(r"^(.*?)\s*\(([^)]+)\)$", line)
+        if m_owner:
+            owner_name = m_owner.group(1).strip()
+            owner_id = m_owner.group(2).strip()
+        else:
+            owner_name = line
+            owner_id = ""
+        owners.append({"Owner_Name": owner_name, "Owner_ID": owner_id})
+    return owners
+
+def parse_court_orders_page(html: str) -> list:
+    """Parse the inner HTML of `table tbody` into court order rows (without No.)."""
+    tbody = fragment(html, "table tbody")
+    rows = []
+    for tr in tbody.iter("tr"):
+        cols = tr.xpath("./td")
+        if not cols:
+            continue
+        texts = [cell_text(td) for td in cols]
+
+        # --- Company Name + Address ---
+        td_text = INVISIBLE.sub(" ", texts[1].strip()) if len(texts) > 1 else ""
+        combined = " ".join([line.strip() for line in td_text.split("\n") if line.strip()])
+        company_name, company_id, address = split_company_info(combined)
+
+        # --- Owners ---
+        owner_text = texts[2].strip() if len(texts) > 2 else ""
+        owners = parse_owners(owner_text)
+        owner_names = "; ".join([o["Owner_Name"] for o in owners])
+        owner_ids = "; ".join([o["Owner_ID"] for o in owners])
+
+        # --- Dates ---
+        date_of_court_order = format_date(texts[3].strip() if len(texts) > 3 else "")
+        date_received = format_date(texts[4].strip() if len(texts) > 4 else "")
+
+        rows.append((company_name, company_id, address, owner_names,
+                     owner_ids, date_of_court_order, date_received))
+    return rows
@@ -0,0 +1,212 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from urllib.parse import urlsplit
+
+# ----------------------------
+# Settings
+# ----------------------------
+USER_AGENT = "*"
+DEFAULT_RATE = 0.5      # requests per second a host starts at
+MIN_RATE = 0.05         # never slower than one request every 20 sec
+MAX_RATE = 4.0          # never faster than this, whatever the host tolerates
+BURST = 2               # token bucket capacity
+STEP_UP = 0.1           # additive increase after a healthy response
+SLOW_LATENCY = 2.0      # latency this many times the best seen counts as strain
+RETRY_STATUSES = (429, 503)
+MAX_RETRIES = 3
+
+
+def host_of(url):
+    return urlsplit(url).netloc.lower()
+
+
+def load_robots(host):
+    """Fetch and parse robots.txt for `host`; None when it cannot be read."""
+    # urllib.request pulls in http.client and ssl; only load it when needed
+    import urllib.request
+    from urllib.robotparser import RobotFileParser
+
+    parser = RobotFileParser()
+    try:
+        with urllib.request.urlopen(f"https://{host}/robots.txt", timeout=10) as resp:
+            parser.parse(resp.read().decode("utf-8", errors="replace").splitlines())
+    except Exception:
+        return None
+    return parser
+
+
+# ----------------------------
+# Per-host state
+# ----------------------------
+class HostState:
+    """Token bucket plus the observations used to adapt its rate."""
+
+    def __init__(self, host, rate=DEFAULT_RATE, max_rate=MAX_RATE):
+        self.host = host
+        self.rate = rate
+        self.max_rate = max_rate
+        self.tokens = 1.0
+        self.updated = time.monotonic()
+        self.cooldown_until = 0.0
+        self.lock = asyncio.Lock()
+        self.robots_checked = False
+        self.crawl_delay = None
+        self.latency_ewma = None
+        self.best_latency = None
+        self.requests = 0
+        self.errors = 0
+        self.throttled = 0
+        self.server_errors = 0
+        self.waited = 0.0
+
+    def refill(self, now):
+        self.tokens = min(BURST, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def slow_down(self, factor):
+        self.rate = max(MIN_RATE, self.rate * factor)
+        self.tokens = min(self.tokens, 0.0)
+
+    def observe(self, status, latency, retry_after=None):
+        self.requests += 1
+        if status is None:
+            self.errors += 1
+            self.slow_down(0.7)
+            return
+        if status in RETRY_STATUSES:
+            self.throttled += 1
+            self.slow_down(0.5)
+            pause = retry_after if retry_after is not None else 1 / self.rate
+            self.cooldown_until = max(self.cooldown_until, time.monotonic() + pause)
+            return
+        if status >= 500:
+            self.server_errors += 1
+            self.slow_down(0.7)
+            return
+
+        # Healthy response: track latency and ease off if the host is straining
+        if self.latency_ewma is None:
+            self.latency_ewma = latency
+        else:
+            self.latency_ewma = 0.8 * self.latency_ewma + 0.2 * latency
+        if self.best_latency is None or self.latency_ewma < self.best_latency:
+            self.best_latency = self.latency_ewma
+        if self.latency_ewma > SLOW_LATENCY * self.best_latency:
+            self.slow_down(0.9)
+        else:
+            self.rate = min(self.max_rate, self.rate + STEP_UP)
+
+    def stats(self):
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "throttled": self.throttled,
+            "server_errors": self.server_errors,
+            "rate": round(self.rate, 3),
+            "max_rate": round(self.max_rate, 3),
+            "crawl_delay": self.crawl_delay,
+            "latency_ewma": round(self.latency_ewma, 3) if self.latency_ewma is not None else None,
+            "waited_sec": round(self.waited, 2),
+        }
+
+
+# ----------------------------
+# Scheduler
+# ----------------------------
+class PolitenessScheduler:
+    """Per-host token buckets that every navigation goes through.
+
+    Rates start at DEFAULT_RATE, grow while a host answers quickly and are cut
+    on 429/5xx, errors or rising latency. A robots.txt Crawl-delay or
+    Request-rate caps the rate for that host.
+    """
+
+    def __init__(self, rate=DEFAULT_RATE, max_rate=MAX_RATE, respect_robots=True):
+        self.rate = rate
+        self.max_rate = max_rate
+        self.respect_robots = respect_robots
+        self.hosts = {}
+
+    def host(self, url):
+        host = host_of(url)
+        if host not in self.hosts:
+            self.hosts[host] = HostState(host, self.rate, self.max_rate)
+        return self.hosts[host]
+
+    async def _check_robots(self, state):
+        state.robots_checked = True
+        if not self.respect_robots:
+            return
+        robots = await asyncio.to_thread(load_robots, state.host)
+        if robots is None:
+            return
+        delay = robots.crawl_delay(USER_AGENT)
+        request_rate = robots.request_rate(USER_AGENT)
+        if request_rate and request_rate.requests:
+            delay = max(delay or 0, request_rate.seconds / request_rate.requests)
+        if delay:
+            state.crawl_delay = float(delay)
+            state.max_rate = min(state.max_rate, 1 / state.crawl_delay)
+            state.rate = min(state.rate, state.max_rate)
+
+    async def acquire(self, url):
+        """Wait until the host of `url` may receive another request."""
+        state = self.host(url)
+        async with state.lock:
+            if not state.robots_checked:
+                await self._check_robots(state)
+            while True:
+                now = time.monotonic()
+                state.refill(now)
+                wait = max(state.cooldown_until - now, (1 - state.tokens) / state.rate)
+                if wait <= 0:
+                    state.tokens -= 1
+                    return
+                state.waited += wait
+                await asyncio.sleep(wait)
+
+    def record(self, url, status, latency, retry_after=None):
+        self.host(url).observe(status, latency, retry_after)
+
+    async def goto(self, page, url, **kwargs):
+        """page.goto() through the scheduler, retrying 429/503 after backing off."""
+        for attempt in range(MAX_RETRIES + 1):
+            await self.acquire(url)
+            start = time.monotonic()
+            try:
+                response = await page.goto(url, **kwargs)
+            except Exception:
+                self.record(url, None, time.monotonic() - start)
+                raise
+            status = response.status if response else 200
+            retry_after = None
+            if response and status in RETRY_STATUSES:
+                header = await response.header_value("retry-after")
+                retry_after = float(header) if header and header.isdigit() else None
+            self.record(url, status, time.monotonic() - start, retry_after)
+            if status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                return response
+            print(f"⏳ {host_of(url)} answered {status}, backing off (attempt {attempt + 1})")
+
+    @asynccontextmanager
+    async def paced(self, url):
+        """Pace an in-page action (pagination click, postback) against `url`'s host."""
+        await self.acquire(url)
+        start = time.monotonic()
+        try:
+            yield
+        except Exception:
+            self.record(url, None, time.monotonic() - start)
+            raise
+        self.record(url, 200, time.monotonic() - start)
+
+    def stats(self):
+        return {host: state.stats() for host, state in self.hosts.items()}
+
+    def print_stats(self):
+        for host, stats in self.stats().items():
+            print(f"📊 {host}: {stats['requests']} requests, {stats['throttled']} throttled, "
+                  f"{stats['server_errors']} 5xx, {stats['errors']} errors, "
+                  f"rate {stats['rate']}/s (max {stats['max_rate']}/s), "
+                  f"waited {stats['waited_sec']} sec")
@@ -0,0 +1,284 @@
+import re
+from dataclasses import dataclass
+from typing import ClassVar
+
+# ----------------------------
+# Source-level constants
+# ----------------------------
+# Columns that are identical on every row of a source are kept here once and
+# attached when a record is turned into an output row, instead of being stored
+# on each record.
+
+SC_SOURCE = {
+    "Dataset": "Suruhanjaya Sekuriti Securities commission malaysia",
+    "Topics": "fraud",
+    "Source Name": "Suruhanjaya Sekuriti Securities commission malaysia",
+    "Country": "Malaysia",
+}
+
+BNM_ALERT_SOURCE = {
+    "Group(sdn Type)": "Company",
+    "Dataset": "Bank Negara Malaysia",
+    "Source URL": "https://www.bnm.gov.my/financial-consumer-alert-list",
+    "Topics": "Fraud",
+    "Source Name": "Bank Negara Malaysia",
+    "Country": "Malaysia",
+}
+
+# ----------------------------
+# Cheap field checks
+# ----------------------------
+ISO_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+COMPANY_ID = re.compile(r"^\(.+\)$")
+MYKAD_ID = re.compile(r"^\d{6}-?\d{2}-?\d{4}$")
+
+# Values the scrapers use for "nothing here"; these are never flagged.
+EMPTY_VALUES = ("", "-")
+
+
+# ----------------------------
+# Base record
+# ----------------------------
+@dataclass
+class Record:
+    """Base for per-source records.
+
+    COLUMNS lists the output columns in order as (header, attribute) pairs;
+    an attribute of None means the value comes from SOURCE.
+    """
+    __slots__ = ()
+
+    COLUMNS: ClassVar[tuple] = ()
+    SOURCE: ClassVar[dict] = {}
+    CHECKS: ClassVar[dict] = {}  # attribute -> compiled pattern
+
+    @classmethod
+    def headers(cls) -> list:
+        return [header for header, _ in cls.COLUMNS]
+
+    def as_row(self) -> list:
+        return [
+            getattr(self, attr) if attr else self.SOURCE[header]
+            for header, attr in self.COLUMNS
+        ]
+
+    def as_dict(self) -> dict:
+        return dict(zip(self.headers(), self.as_row()))
+
+    def validate(self) -> list:
+        """Return the attributes whose value does not match its pattern."""
+        bad = []
+        for attr, pattern in self.CHECKS.items():
+            value = getattr(self, attr)
+            if value not in EMPTY_VALUES and not pattern.match(str(value)):
+                bad.append(attr)
+        return bad
+
+
+# ----------------------------
+# Securities Commission
+# ----------------------------
+@dataclass
+class SCActionRecord(Record):
+    """Row of the SC administrative actions tables."""
+    __slots__ = ("year", "no", "nature", "party", "description",
+                 "action_taken", "date", "source_url")
+
+    year: str
+    no: str
+    nature: str
+    party: str
+    description: str
+    action_taken: str
+    date: str
+    source_url: str
+
+    COLUMNS: ClassVar[tuple] = (
+        ("Year", "year"),
+        ("No.", "no"),
+        ("Nature of Misconduct", "nature"),
+        ("Parties Involved", "party"),
+        ("Brief Description of Misconduct", "description"),
+        ("Action Taken", "action_taken"),
+        ("Date of Action", "date"),
+        ("Dataset", None),
+        ("Topics", None),
+        ("Source Name", None),
+        ("Country", None),
+        ("Source URL", "source_url"),
+    )
+    SOURCE: ClassVar[dict] = SC_SOURCE
+
+
+@dataclass
+class AOBSanctionRecord(SCActionRecord):
+    """Row of the AOB sanctions tables; the date column is normalised."""
+    __slots__ = ()
+
+    COLUMNS: ClassVar[tuple] = (
+        ("Year", "year"),
+        ("No.", "no"),
+        ("Nature of Misconduct", "nature"),
+        ("Auditor", "party"),
+        ("Brief Description of Misconduct", "description"),
+        ("Action Taken", "action_taken"),
+        ("Date of AOB's Action", "date"),
+        ("Dataset", None),
+        ("Topics", None),
+        ("Source Name", None),
+        ("Country", None),
+        ("Source URL", "source_url"),
+    )
+    CHECKS: ClassVar[dict] = {"date": ISO_DATE}
+
+
+@dataclass
+class SCCaseRecord(Record):
+    """Row of the SC cases compounded / criminal prosecution tables."""
+    __slots__ = ("year", "no", "nature", "offenders", "facts",
+                 "date_charged", "source_url")
+
+    year: str
+    no: str
+    nature: str
+    offenders: str
+    facts: str
+    date_charged: str
+    source_url: str
+
+    COLUMNS: ClassVar[tuple] = (
+        ("Year", "year"),
+        ("No.", "no"),
+        ("Nature of Offence", "nature"),
+        ("Offender(s)", "offenders"),
+        ("Facts of Case", "facts"),
+        ("Date Charged", "date_charged"),
+        ("Dataset", None),
+        ("Topics", None),
+        ("Source Name", None),
+        ("Country", None),
+        ("Source URL", "source_url"),
+    )
+    SOURCE: ClassVar[dict] = SC_SOURCE
+
+
+# ----------------------------
+# Bank Negara Malaysia
+# ----------------------------
+@dataclass
+class ConsumerAlertRecord(Record):
+    """Entry of the BNM financial consumer alert list."""
+    __slots__ = ("entity_name", "website_url", "date_added")
+
+    entity_name: str
+    website_url: str
+    date_added: str
+
+    COLUMNS: ClassVar[tuple] = (
+        ("Group(sdn Type)", None),
+        ("Entity Name", "entity_name"),
+        ("Website/URL", "website_url"),
+        ("Dataset", None),
+        ("Source URL", None),
+        ("Topics", None),
+        ("Source Name", None),
+        ("Country", None),
+        ("Date Added", "date_added"),
+    )
+    SOURCE: ClassVar[dict] = BNM_ALERT_SOURCE
+    CHECKS: ClassVar[dict] = {"date_added": ISO_DATE}
+
+
+@dataclass
+class CourtOrderRecord(Record):
+    """Entry of the BNM court orders list."""
+    __slots__ = ("no", "company_name", "company_id", "address", "owner_names",
+                 "owner_ids", "date_of_court_order", "date_received")
+
+    no: int
+    company_name: str
+    company_id: str
+    address: str
+    owner_names: str
+    owner_ids: str
+    date_of_court_order: str
+    date_received: str
+
+    COLUMNS: ClassVar[tuple] = (
+        ("No.", "no"),
+        ("Company_Name", "company_name"),
+        ("Company_ID", "company_id"),
+        ("Address", "address"),
+        ("Company_Owner_Name", "owner_names"),
+        ("Company_Owner_ID", "owner_ids"),
+        ("Date of Court Order", "date_of_court_order"),
+        ("Date Received", "date_received"),
+    )
+    CHECKS: ClassVar[dict] = {
+        "company_id": COMPANY_ID,
+        "date_of_court_order": ISO_DATE,
+        "date_received": ISO_DATE,
+    }
+
+
+@dataclass
+class CompoundRecord(Record):
+    """Row of the BNM compound table for financial services entities."""
+    __slots__ = ("no", "entity", "compound_fsa", "compound_s92", "total")
+
+    no: str
+    entity: str
+    compound_fsa: str
+    compound_s92: str
+    total: str
+
+    COLUMNS: ClassVar[tuple] = (
+        ("No.", "no"),
+        ("Entities", "entity"),
+        ("Compound (RM, million) under - S. 253 FSA", "compound_fsa"),
+        ("Compound (RM, million) under - S. 92", "compound_s92"),
+        ("Total (RM, million)", "total"),
+    )
+
+
+# ----------------------------
+# Royal Malaysia Police
+# ----------------------------
+@dataclass
+class WantedPersonRecord(Record):
+    """Entry of the RMP wanted persons list."""
+    __slots__ = ("name", "alias", "id_number", "gender", "ethnicity",
+                 "date_of_birth", "address", "report_no", "offense", "notes")
+
+    name: str
+    alias: str
+    id_number: str
+    gender: str
+    ethnicity: str
+    date_of_birth: str
+    address: str
+    report_no: str
+    offense: str
+    notes: str
+
+    COLUMNS: ClassVar[tuple] = (
+        ("Name", "name"),
+        ("Alias", "alias"),
+        ("ID Number", "id_number"),
+        ("Gender", "gender"),
+        ("Ethnicity", "ethnicity"),
+        ("Date of Birth", "date_of_birth"),
+        ("Address", "address"),
+        ("Report No", "report_no"),
+        ("Offense", "offense"),
+        ("Notes", "notes"),
+    )
+    CHECKS: ClassVar[dict] = {
+        "id_number": MYKAD_ID,
+        "date_of_birth": ISO_DATE,
+    }
+
+    @classmethod
+    def from_headers(cls, values: dict):
+        """Build a record from a {header: value} dict, missing headers empty."""
+        return cls(*(values.get(header, "") for header, _ in cls.COLUMNS))
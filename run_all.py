@@ -0,0 +1,84 @@
+import argparse
+import asyncio
+import time
+from contextlib import nullcontext
+
+from Administrative_Actions import scrape_sc_data_async
+from Aob_Sanctions import scrape_aob_sanctions_async
+from Compound_Cases import scrape_cases_compounded_async
+from Criminal_Prosecution import scrape_criminal_prosecution_async
+from bnm_Financial_Services import main as scrape_bnm_financial_services
+from browser_manager import BrowserManager
+from consumer_alert import scrape_bnm
+from court_orders import main as scrape_court_orders
+from export import DatasetWriter, new_run_id
+from parsers import parser_pool
+from wanted_persons import scrape_rmp_wanted_async
+
+# ----------------------------
+# All sources, scheduled on one event loop
+# ----------------------------
+SOURCES = {
+    "Administrative Actions": scrape_sc_data_async,
+    "AOB Sanctions": scrape_aob_sanctions_async,
+    "Cases Compounded": scrape_cases_compounded_async,
+    "Criminal Prosecution": scrape_criminal_prosecution_async,
+    "BNM Financial Services": scrape_bnm_financial_services,
+    "BNM Consumer Alerts": scrape_bnm,
+    "BNM Court Orders": scrape_court_orders,
+    "RMP Wanted Persons": scrape_rmp_wanted_async,
+}
+
+# Sources that hand their HTML to the shared parser pool
+POOLED_SOURCES = {"BNM Financial Services", "BNM Court Orders"}
+
+async def run_source(name, scrape, manager, pool, dataset_root=None, run_id=None):
+    """Run one source; with `dataset_root` its records are also exported to Parquet."""
+    start = time.time()
+    kwargs = {"manager": manager}
+    if name in POOLED_SOURCES:
+        kwargs["pool"] = pool
+    exporter = DatasetWriter(name, dataset_root, run_id) if dataset_root else nullcontext()
+    # Time to first row is measured per scrape, also when watch reuses the manager
+    manager.start_source(name)
+    try:
+        with exporter as dataset:
+            if dataset is not None:
+                kwargs["dataset"] = dataset
+            await scrape(**kwargs)
+    except Exception as e:
+        print(f"❌ {name} failed: {e}")
+        return name, False, time.time() - start
+    finally:
+        manager.log_first_rows([name])
+    return name, True, time.time() - start
+
+async def run_all(names=None, dataset_root=None, run_id=None):
+    """Run the selected sources (default: all) concurrently."""
+    selected = names or list(SOURCES)
+    run_id = run_id or new_run_id()
+    with parser_pool() as pool:
+        async with BrowserManager() as manager:
+            results = await asyncio.gather(
+                *(run_source(name, SOURCES[name], manager, pool, dataset_root, run_id)
+                  for name in selected)
+            )
+    for name, ok, elapsed in results:
+        print(f"{'✅' if ok else '❌'} {name}: {elapsed:.2f} sec")
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run all scrapers on one event loop.")
+    parser.add_argument("sources", nargs="*", metavar="SOURCE",
+                        help=f"sources to run (default: all): {', '.join(SOURCES)}")
+    parser.add_argument("--dataset", metavar="DIR",
+                        help="also export records to a partitioned Parquet dataset in DIR")
+    parser.add_argument("--run-id", help="snapshot ID for the export (default: timestamp)")
+    args = parser.parse_args()
+    unknown = [name for name in args.sources if name not in SOURCES]
+    if unknown:
+        parser.error(f"unknown source(s): {', '.join(unknown)}")
+
+    start_total = time.time()
+    asyncio.run(run_all(args.sources, args.dataset, args.run_id))
+    print(f"Total execution time: {time.time() - start_total:.2f} sec")
@@ -0,0 +1,33 @@
+# ----------------------------
+# SC enforcement actions index
+# ----------------------------
+# The Administrative Actions, Cases Compounded and Criminal Prosecution
+# scrapers all start from the per-year links on one index page.
+
+SC_BASE_URL = "https://www.sc.com.my"
+
+# Text and raw href of every link, in a single round trip
+READ_ANCHORS = """links => links.map(a => [a.innerText.trim(), a.getAttribute("href")])"""
+
+async def read_anchors(page):
+    """(text, href) for every <a> on the page."""
+    return await page.eval_on_selector_all("a", READ_ANCHORS)
+
+def year_links(anchors, prefix):
+    """The per-year links among `anchors` whose text starts with `prefix`, newest first."""
+    links = []
+    seen_texts = set()
+    for text, href in anchors:
+        if text.startswith(prefix) and text not in seen_texts:
+            seen_texts.add(text)
+            if not href:
+                continue
+            full_url = href if href.startswith("http") else SC_BASE_URL + href
+            links.append({"year": text, "url": full_url})
+
+    links.sort(key=lambda x: x["year"], reverse=True)
+    return links
+
+async def find_year_links(page, prefix):
+    """Collect the per-year links on the SC enforcement actions index."""
+    return year_links(await read_anchors(page), prefix)
@@ -0,0 +1,21 @@
+import json
+import os
+
+# ----------------------------
+# JSON state files
+# ----------------------------
+# Small per-source state kept between runs (.watch_state.json,
+# .validation_state.json). Writes go through a temporary file so an
+# interrupted run never leaves a truncated state file behind.
+
+def load_state(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+def save_state(state, path):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
@@ -0,0 +1,98 @@
+"""The lxml parsers must give the same text as the code they replaced.
+
+The old court orders scraper stripped tags from inner_html() with regexes
+and the old compound table parser used BeautifulSoup's get_text(strip=True);
+both are reproduced here as references.
+"""
+import html
+import os
+import re
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip("lxml")
+
+from parsers import parse_compound_table, parse_court_orders_page, split_company_info
+
+COMPOUND_TABLE = (
+    "<tbody>"
+    "<tr><th rowspan='2'>No.</th><th rowspan='2'>Entities</th><th colspan='2'>Compound</th>"
+    "<th rowspan='2'>Total</th></tr>"
+    "<tr><th>S. 253 FSA</th><th>S. 92</th></tr>"
+    "<tr><td>1</td><td>Bank&nbsp;A &amp; Co<br>Berhad</td><td> 1.5 </td><td>0.5</td><td>2.0</td></tr>"
+    "<tr><td>2</td><td><p>Bank B</p></td><td>-</td><td>3.0</td><td>3.0</td></tr>"
+    "<tr><td colspan='4'>Total</td><td>5.0</td></tr>"
+    "</tbody>"
+)
+
+COURT_ORDERS_PAGE = (
+    "<tr><td>1</td>"
+    "<td>SYARIKAT CONTOH SDN BHD&nbsp;(123456-X)<br>No. 1, Jalan Ampang,<br>50450 Kuala Lumpur</td>"
+    "<td>Ahmad bin Ali (800101-01-1234)<br>Tan Ah Kow (810202-10-5678)</td>"
+    "<td>5 January 2023</td><td>06/02/2023</td></tr>"
+    "<tr><td>2</td>"
+    "<td>A &amp; B TRADING (JM0123456-K)<br/>Lot 2,&nbsp;Jalan Besar</td>"
+    "<td>Siti binti Omar</td>"
+    "<td>7-03-2023</td><td></td></tr>"
+    "<tr><td>3</td>"
+    "<td>CONTOH BERHAD (654321-A)<p>No. 3, Jalan Tun Razak</p></td>"
+    "<td>Ahmad (800101-01-1234)<div>Tan (810202-10-5678)</div></td>"
+    "<td>1 March 2024</td><td>2 March 2024</td></tr>"
+)
+
+
+def old_compound_rows(table_html):
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(table_html, "html.parser")
+    rows = []
+    for tr in soup.find_all("tr")[2:]:
+        row = [td.get_text(strip=True) for td in tr.find_all("td")]
+        if len(row) < 5:
+            row = [""] * (5 - len(row)) + row
+        rows.append(row)
+    return rows
+
+def old_company_cell(td_html):
+    td_text = re.sub(r"<br\s*/?>", "\n", td_html, flags=re.I)
+    td_text = re.sub(r"<.*?>", "", td_text).strip()
+    td_text = re.sub(r"[\xa0\u200b]+", " ", td_text)
+    combined = " ".join([line.strip() for line in td_text.split("\n") if line.strip()])
+    return split_company_info(combined)
+
+
+def test_compound_table_rows():
+    assert parse_compound_table(COMPOUND_TABLE) == [
+        ["1", "Bank\xa0A & CoBerhad", "1.5", "0.5", "2.0"],
+        ["2", "Bank B", "-", "3.0", "3.0"],
+        ["", "", "", "Total", "5.0"],
+    ]
+
+def test_compound_table_keeps_extra_cells():
+    extra = COMPOUND_TABLE.replace("<td>2.0</td></tr>", "<td>2.0</td><td>new</td></tr>")
+    assert parse_compound_table(extra)[0] == ["1", "Bank\xa0A & CoBerhad", "1.5", "0.5", "2.0", "new"]
+
+def test_compound_table_matches_beautifulsoup():
+    pytest.importorskip("bs4")
+    assert parse_compound_table(COMPOUND_TABLE) == old_compound_rows("<table>" + COMPOUND_TABLE + "</table>")
+
+def test_court_orders_company_matches_old_regex_parse():
+    rows = parse_court_orders_page(COURT_ORDERS_PAGE)
+    cells = re.findall(r"<tr><td>\d+</td><td>(.*?)</td>", COURT_ORDERS_PAGE)
+    for row, td_html in zip(rows, cells):
+        # The old code left entities such as &amp; and &nbsp; undecoded
+        assert row[:3] == old_company_cell(html.unescape(td_html))
+
+def test_court_orders_rows():
+    assert parse_court_orders_page(COURT_ORDERS_PAGE) == [
+        ("SYARIKAT CONTOH SDN BHD", "(123456-X)", "No. 1, Jalan Ampang, 50450 Kuala Lumpur",
+         "Ahmad bin Ali; Tan Ah Kow", "800101-01-1234; 810202-10-5678",
+         "2023-01-05", "2023-02-06"),
+        ("A & B TRADING", "(JM0123456-K)", "Lot 2, Jalan Besar",
+         "Siti binti Omar", "", "2023-03-07", ""),
+        ("CONTOH BERHAD", "(654321-A)", "No. 3, Jalan Tun Razak",
+         "Ahmad; Tan", "800101-01-1234; 810202-10-5678", "2024-03-01", "2024-03-02"),
+    ]
@@ -0,0 +1,192 @@
+import json
+import os
+from contextlib import contextmanager
+from datetime import datetime
+
+from records import EMPTY_VALUES, ISO_DATE
+from state import load_state, save_state
+
+# ----------------------------
+# Settings
+# ----------------------------
+STATE_FILE = ".validation_state.json"   # last published run per source
+QUARANTINE_DIR = "quarantine"
+
+MIN_DATE_PARSE_RATE = 0.9   # share of non-empty date fields that must normalise
+MIN_FIELD_PASS_RATE = 0.5   # same for other checked fields (IDs)
+MIN_ROW_RATIO = 0.5         # rows must be at least this share of the last run
+MAX_FILL_DROP = 0.3         # a column's fill ratio may not fall by more than this
+MAX_MALFORMED_RATE = 0.05   # rows the scraper could not read at all
+FAIL_FAST_AFTER = 50        # rows seen before the date rate can fail the run early
+MAX_FAILED_PAGES = 0        # pages that may fail to load or parse before the run is rejected
+
+
+class ValidationError(Exception):
+    """Raised when a source's output should not be published."""
+
+
+# ----------------------------
+# Streaming validator
+# ----------------------------
+class SourceValidator:
+    """Running checks for one source's records, using counters only.
+
+    Call `add()` for every record that will be published, `malformed()` for
+    rows that could not be read, `page_failed()` for a page that could not be
+    loaded at all, `schema_drift()` when a page no longer has the expected
+    shape and `quarantine()` to set a page aside instead of publishing it. `finish()` compares the run with the previous published
+    one and raises ValidationError if it looks broken.
+    """
+
+    def __init__(self, source, state_path=STATE_FILE, quarantine_dir=QUARANTINE_DIR):
+        self.source = source
+        self.state_path = state_path
+        self.quarantine_dir = quarantine_dir
+        self.record_cls = None
+        self.headers = None
+        self.filled = None
+        self.checked = {}
+        self.failed = {}
+        self.rows = 0
+        self.malformed_rows = 0
+        self.expected_rows = None
+        self.quarantined_pages = 0
+        self.failed_pages = 0
+        self.drift = []
+        self.previous = load_state(state_path).get(source, {})
+
+    def add(self, record):
+        if self.record_cls is None:
+            self.record_cls = type(record)
+            self.headers = record.headers()
+            self.filled = [0] * len(self.headers)
+        self.rows += 1
+        for i, value in enumerate(record.as_row()):
+            if value not in EMPTY_VALUES and value is not None:
+                self.filled[i] += 1
+        for attr in record.CHECKS:
+            if getattr(record, attr) not in EMPTY_VALUES:
+                self.checked[attr] = self.checked.get(attr, 0) + 1
+        for attr in record.validate():
+            self.failed[attr] = self.failed.get(attr, 0) + 1
+
+        # Fail fast when date parsing is clearly broken
+        if self.rows == FAIL_FAST_AFTER:
+            problems = self.rate_problems()
+            if problems:
+                raise ValidationError(f"{self.source}: {'; '.join(problems)} "
+                                      f"after {self.rows} rows")
+
+    def malformed(self, count=1):
+        self.malformed_rows += count
+
+    def expect_rows(self, count):
+        """Row count the site itself reports, when it does."""
+        self.expected_rows = count
+
+    def page_failed(self, where, error):
+        """A page that could not be loaded or parsed; raises once too many have failed."""
+        self.failed_pages += 1
+        self.quarantine(where, f"page failed: {error}", [])
+        if self.failed_pages > MAX_FAILED_PAGES:
+            raise ValidationError(f"{self.source}: {where} failed ({error}), "
+                                  f"output would be incomplete")
+
+    def schema_drift(self, where, detail):
+        self.drift.append(f"{where}: {detail}")
+        print(f"⚠️ {self.source} schema drift at {where}: {detail}")
+
+    def quarantine(self, where, reason, rows):
+        """Write a page's rows to the quarantine file instead of the output."""
+        self.quarantined_pages += 1
+        os.makedirs(self.quarantine_dir, exist_ok=True)
+        path = os.path.join(self.quarantine_dir, f"{self.source}.jsonl")
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({
+                "quarantined_at": datetime.now().isoformat(timespec="seconds"),
+                "source": self.source,
+                "page": where,
+                "reason": reason,
+                "rows": rows,
+            }, ensure_ascii=False) + "\n")
+        print(f"🚧 {self.source}: quarantined {where} ({reason})")
+
+    def rate_problems(self):
+        problems = []
+        for attr, checked in self.checked.items():
+            rate = 1 - self.failed.get(attr, 0) / checked
+            pattern = self.record_cls.CHECKS.get(attr)
+            minimum = MIN_DATE_PARSE_RATE if pattern is ISO_DATE else MIN_FIELD_PASS_RATE
+            if rate < minimum:
+                problems.append(f"{attr} valid for {rate:.0%} of rows (min {minimum:.0%})")
+        return problems
+
+    def fill_ratios(self):
+        if not self.rows:
+            return {}
+        return {h: round(n / self.rows, 3) for h, n in zip(self.headers, self.filled)}
+
+    def problems(self):
+        if not self.rows:
+            return ["no rows"]
+        problems = self.rate_problems()
+
+        if self.failed_pages > MAX_FAILED_PAGES:
+            problems.append(f"{self.failed_pages} pages failed")
+        seen = self.rows + self.malformed_rows
+        if self.malformed_rows / seen > MAX_MALFORMED_RATE:
+            problems.append(f"{self.malformed_rows} of {seen} rows unreadable")
+        if self.expected_rows and self.rows < self.expected_rows * (1 - MAX_MALFORMED_RATE):
+            problems.append(f"{self.rows} rows but the site lists {self.expected_rows}")
+
+        previous_rows = self.previous.get("rows")
+        if previous_rows and self.rows < previous_rows * MIN_ROW_RATIO:
+            problems.append(f"{self.rows} rows, last run had {previous_rows}")
+        previous_fill = self.previous.get("fill", {})
+        for header, ratio in self.fill_ratios().items():
+            before = previous_fill.get(header)
+            if before is not None and before - ratio > MAX_FILL_DROP:
+                problems.append(f"'{header}' filled for {ratio:.0%} of rows, was {before:.0%}")
+        return problems
+
+    def finish(self):
+        """Raise ValidationError if the run looks broken, else remember it as the baseline."""
+        problems = self.problems()
+        summary = (f"{self.source}: {self.rows} rows, {self.malformed_rows} unreadable, "
+                   f"{self.quarantined_pages} pages quarantined, {len(self.drift)} drift warnings")
+        if problems:
+            raise ValidationError(f"{summary}; " + "; ".join(problems))
+        print(f"🔍 {summary}")
+
+        state = load_state(self.state_path)
+        state[self.source] = {
+            "rows": self.rows,
+            "fill": self.fill_ratios(),
+            "validated_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        save_state(state, self.state_path)
+
+
+# ----------------------------
+# Publishing
+# ----------------------------
+@contextmanager
+def publish_when_valid(path, validator):
+    """Yield a temporary path to write to; it replaces `path` only if validation passes.
+
+    On failure the rejected file is moved to the quarantine directory and the
+    previous output at `path` is left untouched.
+    """
+    tmp_path = path + ".tmp"
+    try:
+        yield tmp_path
+        validator.finish()
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.makedirs(validator.quarantine_dir, exist_ok=True)
+            stamp = datetime.now().strftime("%Y%m%dT%H%M%S")
+            rejected = os.path.join(validator.quarantine_dir, f"{stamp}-{os.path.basename(path)}")
+            os.replace(tmp_path, rejected)
+            print(f"🚫 {os.path.basename(path)} not published; rejected output kept at {rejected}")
+        raise
+    os.replace(tmp_path, path)
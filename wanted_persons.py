@@ -1,14 +1,30 @@
+import asyncio
 import csv
 import time
 import re
+import threading
+from contextlib import nullcontext
 from datetime import datetime
-from playwright.sync_api import sync_playwright
-from deep_translator import GoogleTranslator
+from browser_manager import use_browser
+from records import WantedPersonRecord
+from validation import SourceValidator, publish_when_valid
 
 # ----------------------------
 # Setup Google Translator
 # ----------------------------
-translator = GoogleTranslator(source='ms', target='en')
+_local = threading.local()
+
+def get_translator():
+    """This thread's translator, created on first use; deep_translator is slow to import.
+
+    GoogleTranslator keeps the text being translated on the instance, so
+    threads must not share one.
+    """
+    translator = getattr(_local, "translator", None)
+    if translator is None:
+        from deep_translator import GoogleTranslator
+        translator = _local.translator = GoogleTranslator(source='ms', target='en')
+    return translator
 
 def is_numeric_field(value: str) -> bool:
     """Skip translation for numeric or mostly numeric fields"""
@@ -22,7 +38,7 @@ def translate_text(text: str):
 
     start = time.time()
     try:
-        translated = translator.translate(text)
+        translated = get_translator().translate(text)
     except Exception as e:
         print(f"Translation error: {e}")
         translated = text
@@ -30,103 +46,227 @@ def translate_text(text: str):
     return translated, end - start
 
 # ----------------------------
-# HTML Flattening
+# Bulk extraction
 # ----------------------------
-def flatten_html(cell):
-    text = cell.inner_text()
-    return " ".join(text.split())
+URL = "https://www.rmp.gov.my/orang-dikehendaki"
+EXPAND_ALL = "#ctl00_Contentplaceholder2_C068_ctl00_ctl00_ctl00_listsControl_listExpandAllLnk"
+COLLAPSE_ALL = "#ctl00_Contentplaceholder2_C068_ctl00_ctl00_ctl00_listsControl_listCollapseAllLnk"
+PAGER_LINKS = ".sf_pagerNumeric a[href], ul.pagination a[href]"
+MAX_CONCURRENT_PAGES = 4
+MAX_CONCURRENT_TRANSLATIONS = 4   # persons translated at once, to go easy on Google
 
-# ----------------------------
-# Scraper
-# ----------------------------
-def scrape_rmp_wanted():
-    url = "https://www.rmp.gov.my/orang-dikehendaki"
-
-    headers = ['Name', 'Alias', 'ID Number', 'Gender', 'Ethnicity',
-               'Date of Birth', 'Address', 'Report No', 'Offense', 'Notes']
-
-    label_map = {
-        "Nama": "Name",
-        "Nama Gelaran": "Alias",
-        "No. KP": "ID Number",
-        "Jantina": "Gender",
-        "Bangsa": "Ethnicity",
-        "Tarikh lahir": "Date of Birth",
-        "Alamat": "Address",
-        "Repot No": "Report No",
-        "Kesalahan": "Offense",
-        "Catatan": "Notes"
+label_map = {
+    "Nama": "Name",
+    "Nama Gelaran": "Alias",
+    "No. KP": "ID Number",
+    "Jantina": "Gender",
+    "Bangsa": "Ethnicity",
+    "Tarikh lahir": "Date of Birth",
+    "Alamat": "Address",
+    "Repot No": "Report No",
+    "Kesalahan": "Offense",
+    "Catatan": "Notes"
+}
+
+# One person block is a table with <strong> labels, each followed by its
+# value cell. Only a table's own rows, cells and labels are read, so a block
+# nested inside another table is returned once, by the inner table.
+EXTRACT_PERSONS = """() => {
+    const flat = el => el.innerText.split(/\\s+/).filter(Boolean).join(" ");
+    const blocks = [];
+    for (const table of document.querySelectorAll("table")) {
+        const pairs = [];
+        for (const row of table.rows) {
+            const cells = [...row.cells];
+            let i = 0;
+            while (i < cells.length) {
+                const label = [...cells[i].querySelectorAll("strong")]
+                    .find(strong => strong.closest("table") === table);
+                if (label) {
+                    pairs.push([flat(label), i + 1 < cells.length ? flat(cells[i + 1]) : ""]);
+                    i += 2;
+                } else {
+                    i += 1;
+                }
+            }
+        }
+        if (pairs.length) blocks.push(pairs);
     }
+    return blocks;
+}"""
+
+async def load_list(browser, page, url):
+    """Open one list page, expand every entry and scroll until nothing new loads."""
+    await browser.goto(page, url)
+    await page.wait_for_timeout(2000)
+
+    # Click "Expand All"
+    if await page.query_selector(EXPAND_ALL):
+        async with browser.paced(page):
+            await page.click(EXPAND_ALL)
+            await page.wait_for_selector(COLLAPSE_ALL, state="visible", timeout=15000)
+
+    # Lazy-loaded lists grow as we scroll; stop once the table count settles
+    count = -1
+    for _ in range(20):
+        tables = await page.evaluate("document.querySelectorAll('table').length")
+        if tables == count:
+            break
+        count = tables
+        await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+        await page.wait_for_timeout(500)
+
+async def extract_persons(page):
+    """All person blocks on the page as lists of (label, value) pairs, in one round trip."""
+    return await page.evaluate(EXTRACT_PERSONS)
+
+async def find_page_urls(page):
+    """Other list pages linked from the pager, in order, if the list is paginated."""
+    hrefs = await page.eval_on_selector_all(PAGER_LINKS, "links => links.map(a => a.href)")
+    urls = []
+    for href in hrefs:
+        if href and href != page.url and href not in urls and not href.startswith("javascript:"):
+            urls.append(href)
+    return urls
+
+async def scrape_page(browser, url):
+    page = await browser.new_page("rmp.gov.my", "RMP Wanted Persons")
+    try:
+        await load_list(browser, page, url)
+        return await extract_persons(page)
+    finally:
+        await page.close()
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-        page.goto(url)
-        page.wait_for_timeout(2000)
+def map_labels(pairs):
+    """Map Malay labels to our headers; unknown labels are kept as-is."""
+    person = {}
+    for label, value in pairs:
+        label = label.replace(":", "").strip()
+        person[label_map.get(label, label)] = value
+    return person
 
-        # Click "Expand All"
-        page.click("#ctl00_Contentplaceholder2_C068_ctl00_ctl00_ctl00_listsControl_listExpandAllLnk")
-        page.wait_for_selector(
-            "#ctl00_Contentplaceholder2_C068_ctl00_ctl00_ctl00_listsControl_listCollapseAllLnk",
-            state="visible",
-            timeout=15000
-        )
+def translate_fields(values):
+    """Translate values one after another with this thread's translator."""
+    return [translate_text(value) for value in values]
 
-        tables = page.query_selector_all("table")
-        tables = [t for t in tables if t.query_selector("strong")]
+async def translate_person(person, limit=None):
+    """Translate all of a person's fields; return (person, latencies).
 
-        with open("rmp_wanted_deeptrans.csv", "w", newline="", encoding="utf-8") as f:
+    Each person's fields go through one worker thread; `limit` is a
+    semaphore bounding how many persons are translated at once.
+    """
+    headers = [h for h, v in person.items() if v.strip()]
+    # The translator blocks on HTTP, keep it off the event loop
+    async with limit or nullcontext():
+        results = await asyncio.to_thread(translate_fields, [person[h] for h in headers])
+    translated = {h: "" for h in person}
+    latencies = []
+    for header, (value_en, latency) in zip(headers, results):
+        translated[header] = value_en
+        latencies.append(latency)
+
+    # Convert Date of Birth to yyyy-mm-dd
+    dob_text = translated.get("Date of Birth", "").strip()
+    if dob_text:
+        try:
+            dob = datetime.strptime(dob_text, "%d/%m/%Y")
+            translated["Date of Birth"] = dob.strftime("%Y-%m-%d")
+        except ValueError:
+            pass
+    return translated, latencies
+
+# ----------------------------
+# Scraper
+# ----------------------------
+async def scrape_rmp_wanted_async(manager=None, dataset=None):
+    headers = WantedPersonRecord.headers()
+
+    async with use_browser(manager) as browser:
+        page = await browser.new_page("rmp.gov.my", "RMP Wanted Persons")
+        try:
+            await load_list(browser, page, URL)
+            first_blocks = await extract_persons(page)
+            page_urls = await find_page_urls(page)
+        finally:
+            await page.close()
+        if page_urls:
+            print(f"🔎 List has {len(page_urls) + 1} pages")
+
+        validator = SourceValidator("RMP Wanted Persons")
+        with publish_when_valid("rmp_wanted_deeptrans.csv", validator) as out_path, \
+                open(out_path, "w", newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
             writer.writerow(headers)
 
             total_translation_time = 0
             translation_count = 0
+            seen = set()
+            unknown_labels = set()
+            translations = asyncio.Semaphore(MAX_CONCURRENT_TRANSLATIONS)
 
-            for table in tables:
-                rows = table.query_selector_all("tr")
-                row_dict = {header: "" for header in headers}
-
-                for row in rows:
-                    cells = row.query_selector_all("td")
-                    i = 0
-                    while i < len(cells):
-                        label_el = cells[i].query_selector("strong")
-                        if label_el:
-                            label = flatten_html(label_el).replace(":", "").strip()
-                            value = flatten_html(cells[i+1]) if i+1 < len(cells) else ""
-                            header = label_map.get(label, label)
-
-                            if value.strip():
-                                value_en, latency = translate_text(value)
-                                total_translation_time += latency
-                                if latency > 0:
-                                    translation_count += 1
-                            else:
-                                value_en = ""
-
-                            # Convert Date of Birth to yyyy-mm-dd
-                            if header == "Date of Birth" and value_en.strip():
-                                try:
-                                    dob = datetime.strptime(value_en.strip(), "%d/%m/%Y")
-                                    value_en = dob.strftime("%Y-%m-%d")
-                                except ValueError:
-                                    pass
-
-                            row_dict[header] = value_en
-                            i += 2
-                        else:
-                            i += 1
-
-                writer.writerow([row_dict[h] for h in headers])
-
-        browser.close()
+            async def write_blocks(blocks):
+                nonlocal total_translation_time, translation_count
+                persons = []
+                for pairs in blocks:
+                    # Only a hash per person is kept, not the person itself
+                    key = hash(tuple(map(tuple, pairs)))
+                    if key in seen:
+                        continue
+                    seen.add(key)
+
+                    # A label we have no column for means the page layout changed
+                    person = map_labels(pairs)
+                    for label in person.keys() - set(label_map.values()) - unknown_labels:
+                        unknown_labels.add(label)
+                        validator.schema_drift(person.get("Name") or "person block",
+                                               f"unknown label {label!r}")
+                    persons.append(person)
+
+                # Translate the page's persons concurrently, write them in page order
+                translated = await asyncio.gather(
+                    *(translate_person(person, translations) for person in persons)
+                )
+                for person, latencies in translated:
+                    total_translation_time += sum(latencies)
+                    translation_count += sum(1 for latency in latencies if latency > 0)
+
+                    record = WantedPersonRecord.from_headers(person)
+                    bad_fields = record.validate()
+                    if bad_fields:
+                        print(f"Unexpected {', '.join(bad_fields)} for {record.name}")
+                    validator.add(record)
+                    writer.writerow(record.as_row())
+                    if dataset is not None:
+                        dataset.add(record)
+                    browser.first_row("RMP Wanted Persons")
+
+            await write_blocks(first_blocks)
+            del first_blocks
+
+            # Fetch further pages a few at a time and write each batch in page
+            # order, so only MAX_CONCURRENT_PAGES pages are held at once
+            for start in range(0, len(page_urls), MAX_CONCURRENT_PAGES):
+                batch = page_urls[start:start + MAX_CONCURRENT_PAGES]
+                results = await asyncio.gather(
+                    *(scrape_page(browser, url) for url in batch), return_exceptions=True
+                )
+                for url, blocks in zip(batch, results):
+                    if isinstance(blocks, Exception):
+                        print(f"Error scraping {url}: {blocks}")
+                        validator.page_failed(url, blocks)
+                        continue
+                    await write_blocks(blocks)
 
         print(f"✅ Scraping completed. Data saved to rmp_wanted_deeptrans.csv")
         if translation_count > 0:
             print(f"Average translation latency per field: {total_translation_time/translation_count:.3f} sec")
             print(f"Total translation time for all fields: {total_translation_time:.2f} sec")
 
+def scrape_rmp_wanted():
+    """Blocking entry point; runs the async scraper on its own event loop."""
+    asyncio.run(scrape_rmp_wanted_async())
+
 if __name__ == "__main__":
     start_total = time.time()
     scrape_rmp_wanted()
-    print(f"Total execution time: {time.time() - start_total:.2f} sec")
\ No newline at end of file
+    print(f"Total execution time: {time.time() - start_total:.2f} sec")
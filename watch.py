@@ -0,0 +1,198 @@
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import time
+from datetime import datetime, timedelta
+
+import Administrative_Actions
+import Aob_Sanctions
+import Compound_Cases
+import Criminal_Prosecution
+import consumer_alert
+import court_orders
+from browser_manager import BrowserManager
+from export import new_run_id
+from parsers import parser_pool
+from run_all import SOURCES, run_source
+from sc_index import read_anchors, year_links
+from state import load_state, save_state
+
+# ----------------------------
+# Settings
+# ----------------------------
+STATE_FILE = ".watch_state.json"
+DEFAULT_INTERVAL = 300   # seconds between polls
+JITTER = 0.1             # +/- fraction of the interval
+DEFAULT_MAX_AGE = 86400  # seconds before a source is scraped again regardless of signals
+MAX_BACKOFF = 6 * 3600   # longest wait before retrying a failing source
+
+# Resources a signal page never needs
+BLOCKED_RESOURCES = ("image", "media", "font", "stylesheet")
+
+SC_INDEX_SOURCES = {
+    "Administrative Actions": Administrative_Actions,
+    "Cases Compounded": Compound_Cases,
+    "Criminal Prosecution": Criminal_Prosecution,
+}
+
+
+# ----------------------------
+# Signals
+# ----------------------------
+# Each signal loads one page and returns {source name: value}; a full scrape
+# of a source runs when its value changes. Signals only see new years, new
+# entries or a new newest row, so every source is also scraped once it is
+# older than --max-age; BNM Financial Services and RMP Wanted Persons have
+# no signal and rely on that alone.
+
+async def read_sc_index(browser, page):
+    """Year links on the SC enforcement actions index, per source."""
+    await browser.goto(page, Administrative_Actions.URL)
+    await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+    await page.wait_for_load_state("networkidle")
+    # All link texts in one round trip, then filtered per source
+    anchors = await read_anchors(page)
+    signals = {}
+    for name, module in SC_INDEX_SOURCES.items():
+        signals[name] = [link["year"] for link in year_links(anchors, module.LINK_PREFIX)]
+    return signals
+
+async def read_aob(browser, page):
+    return {"AOB Sanctions": await Aob_Sanctions.read_signal(browser, page)}
+
+async def read_consumer_alerts(browser, page):
+    return {"BNM Consumer Alerts": await consumer_alert.read_signal(browser, page)}
+
+async def read_court_orders(browser, page):
+    return {"BNM Court Orders": await court_orders.read_signal(browser, page)}
+
+SIGNALS = [
+    ("sc.com.my", read_sc_index),
+    ("sc.com.my", read_aob),
+    ("bnm.gov.my", read_consumer_alerts),
+    ("bnm.gov.my", read_court_orders),
+]
+
+def fingerprint(value):
+    return hashlib.sha1(json.dumps(value, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+# ----------------------------
+# State
+# ----------------------------
+def seconds_since(timestamp, now):
+    return (now - datetime.fromisoformat(timestamp)).total_seconds()
+
+def stale_sources(state, max_age, now):
+    """Sources never scraped, or last scraped more than `max_age` seconds ago."""
+    if not max_age:
+        return []
+    return [name for name in SOURCES
+            if "scraped_at" not in state.get(name, {})
+            or seconds_since(state[name]["scraped_at"], now) > max_age]
+
+def backing_off(entry, now):
+    """True while a failing source waits for its next retry."""
+    return "retry_at" in entry and datetime.fromisoformat(entry["retry_at"]) > now
+
+def record_result(state, name, ok, fingerprint, interval, now):
+    entry = state.setdefault(name, {})
+    if ok:
+        if fingerprint is not None:
+            entry["fingerprint"] = fingerprint
+        entry["scraped_at"] = now.isoformat(timespec="seconds")
+        entry.pop("failures", None)
+        entry.pop("retry_at", None)
+        return
+    # The fingerprint is left alone so the source is retried, after a
+    # delay that doubles with every consecutive failure
+    entry["failures"] = entry.get("failures", 0) + 1
+    delay = min(interval * 2 ** entry["failures"], MAX_BACKOFF)
+    entry["retry_at"] = (now + timedelta(seconds=delay)).isoformat(timespec="seconds")
+    print(f"⏳ {name} failed {entry['failures']} time(s) in a row, retrying in {delay / 60:.0f} min")
+
+
+# ----------------------------
+# Watch loop
+# ----------------------------
+async def block_heavy_resources(route):
+    if route.request.resource_type in BLOCKED_RESOURCES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+async def poll(manager, state):
+    """Read every signal; return {source: fingerprint} for sources that changed."""
+    changed = {}
+    for site, read in SIGNALS:
+        page = await manager.new_page(site)
+        await page.route("**/*", block_heavy_resources)
+        try:
+            signals = await read(manager, page)
+        except Exception as e:
+            print(f"⚠️ Signal {read.__name__} failed: {e}")
+            continue
+        finally:
+            await page.close()
+
+        for source, value in signals.items():
+            new = fingerprint(value)
+            if state.get(source, {}).get("fingerprint") != new:
+                print(f"🔔 {source} changed: {str(value)[:80]}")
+                changed[source] = new
+    return changed
+
+async def watch(interval=DEFAULT_INTERVAL, once=False, state_path=STATE_FILE, dataset_root=None,
+                max_age=DEFAULT_MAX_AGE):
+    state = load_state(state_path)
+    with parser_pool() as pool:
+        async with BrowserManager() as manager:
+            while True:
+                started = time.time()
+                changed = await poll(manager, state)
+                now = datetime.now()
+                for name in stale_sources(state, max_age, now):
+                    if name not in changed:
+                        print(f"🕒 {name} is older than {max_age} sec, scraping in full")
+                        changed[name] = None
+                due = [name for name in changed if not backing_off(state.get(name, {}), now)]
+                if due:
+                    run_id = new_run_id()
+                    results = await asyncio.gather(
+                        *(run_source(name, SOURCES[name], manager, pool, dataset_root, run_id)
+                          for name in due)
+                    )
+                    now = datetime.now()
+                    for name, ok, elapsed in results:
+                        print(f"{'✅' if ok else '❌'} {name}: {elapsed:.2f} sec")
+                        record_result(state, name, ok, changed[name], interval, now)
+                    save_state(state, state_path)
+                elif changed:
+                    print(f"Changed sources are backing off: {', '.join(changed)}")
+                else:
+                    print(f"No changes ({time.time() - started:.1f} sec poll)")
+
+                if once:
+                    break
+                await asyncio.sleep(interval * random.uniform(1 - JITTER, 1 + JITTER))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Poll cheap change signals and scrape only the sources that changed."
+    )
+    parser.add_argument("--interval", type=int, default=DEFAULT_INTERVAL,
+                        help="seconds between polls (default: %(default)s)")
+    parser.add_argument("--once", action="store_true", help="poll once and exit")
+    parser.add_argument("--state", default=STATE_FILE, help="signal state file")
+    parser.add_argument("--max-age", type=int, default=DEFAULT_MAX_AGE,
+                        help="scrape a source in full once its last scrape is older than this "
+                             "many seconds, signal or not; 0 disables (default: %(default)s)")
+    parser.add_argument("--dataset", metavar="DIR",
+                        help="also export each scrape to a partitioned Parquet dataset in DIR")
+    args = parser.parse_args()
+    try:
+        asyncio.run(watch(args.interval, args.once, args.state, args.dataset, args.max_age))
+    except KeyboardInterrupt:
+        print("Stopped watching")